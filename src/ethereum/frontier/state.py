@@ -396,6 +396,28 @@ def move_ether(
     modify_state(state, recipient_address, increase_recipient_balance)
 
 
+def move_all_ether(
+    state: State,
+    sender_address: Address,
+    recipient_address: Address,
+) -> None:
+    """
+    Move the entire balance of an account to another account. If both are the
+    same account, its balance is destroyed.
+    """
+    amount = get_account(state, sender_address).balance
+
+    def clear_sender_balance(sender: Account) -> None:
+        sender.balance = U256(0)
+
+    def increase_recipient_balance(recipient: Account) -> None:
+        recipient.balance += amount
+
+    if recipient_address != sender_address:
+        modify_state(state, recipient_address, increase_recipient_balance)
+    modify_state(state, sender_address, clear_sender_balance)
+
+
 def set_account_balance(state: State, address: Address, amount: U256) -> None:
     """
     Sets the balance of an account.
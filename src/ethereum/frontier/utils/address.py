@@ -21,6 +21,9 @@ from ethereum.utils.byte import left_pad_zero_bytes
 
 from ..fork_types import Address
 
+# The low 160 bits of a word, which are the bytes an address is made of.
+_ADDRESS_MASK = 2**160 - 1
+
 
 def to_address(data: Union[Uint, U256]) -> Address:
     """
@@ -36,7 +39,7 @@ def to_address(data: Union[Uint, U256]) -> Address:
     address : `Address`
         The obtained address.
     """
-    return Address(data.to_be_bytes32()[-20:])
+    return Address((int(data) & _ADDRESS_MASK).to_bytes(20, "big"))
 
 
 def compute_contract_address(address: Address, nonce: Uint) -> Address:
@@ -14,7 +14,7 @@ The abstract computer which runs the code stored in an
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Set, Tuple, Union
+from typing import List, Optional, Set, Union
 
 from ethereum_types.bytes import Bytes, Bytes0
 from ethereum_types.numeric import U256, Uint
@@ -28,6 +28,8 @@ from ..state import State
 
 __all__ = ("Environment", "Evm", "Message")
 
+STACK_DEPTH_LIMIT = Uint(1024)
+
 
 @dataclass
 class Environment:
@@ -66,7 +68,7 @@ class Message:
     parent_evm: Optional["Evm"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Evm:
     """The internal state of the virtual machine."""
 
@@ -74,10 +76,15 @@ class Evm:
     stack: List[U256]
     memory: bytearray
     code: Bytes
+    code_size: U256
+    call_data_size: U256
+    address_word: U256
+    caller_word: U256
+    origin_word: U256
     gas_left: Uint
     env: Environment
     valid_jump_destinations: Set[Uint]
-    logs: Tuple[Log, ...]
+    logs: List[Log]
     refund_counter: int
     running: bool
     message: Message
@@ -98,7 +105,7 @@ def incorporate_child_on_success(evm: Evm, child_evm: Evm) -> None:
         The child evm to incorporate.
     """
     evm.gas_left += child_evm.gas_left
-    evm.logs += child_evm.logs
+    evm.logs.extend(child_evm.logs)
     evm.refund_counter += child_evm.refund_counter
     evm.accounts_to_delete.update(child_evm.accounts_to_delete)
 
@@ -51,9 +51,6 @@ def add(evm: Evm) -> None:
 
     push(evm.stack, result)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def sub(evm: Evm) -> None:
     """
@@ -78,9 +75,6 @@ def sub(evm: Evm) -> None:
 
     push(evm.stack, result)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def mul(evm: Evm) -> None:
     """
@@ -105,9 +99,6 @@ def mul(evm: Evm) -> None:
 
     push(evm.stack, result)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def div(evm: Evm) -> None:
     """
@@ -135,9 +126,6 @@ def div(evm: Evm) -> None:
 
     push(evm.stack, quotient)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 U255_CEIL_VALUE = 2**255
 
@@ -171,9 +159,6 @@ def sdiv(evm: Evm) -> None:
 
     push(evm.stack, U256.from_signed(quotient))
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def mod(evm: Evm) -> None:
     """
@@ -201,9 +186,6 @@ def mod(evm: Evm) -> None:
 
     push(evm.stack, remainder)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def smod(evm: Evm) -> None:
     """
@@ -231,9 +213,6 @@ def smod(evm: Evm) -> None:
 
     push(evm.stack, U256.from_signed(remainder))
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def addmod(evm: Evm) -> None:
     """
@@ -262,9 +241,6 @@ def addmod(evm: Evm) -> None:
 
     push(evm.stack, result)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def mulmod(evm: Evm) -> None:
     """
@@ -293,9 +269,6 @@ def mulmod(evm: Evm) -> None:
 
     push(evm.stack, result)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def exp(evm: Evm) -> None:
     """
@@ -326,9 +299,6 @@ def exp(evm: Evm) -> None:
 
     push(evm.stack, result)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def signextend(evm: Evm) -> None:
     """
@@ -368,6 +338,3 @@ def signextend(evm: Evm) -> None:
             )
 
     push(evm.stack, result)
-
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
@@ -12,7 +12,7 @@ Introduction
 Implementations of the EVM bitwise instructions.
 """
 
-from ethereum_types.numeric import U256, Uint
+from ethereum_types.numeric import U256
 
 from .. import Evm
 from ..gas import GAS_VERY_LOW, charge_gas
@@ -40,9 +40,6 @@ def bitwise_and(evm: Evm) -> None:
     # OPERATION
     push(evm.stack, x & y)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def bitwise_or(evm: Evm) -> None:
     """
@@ -65,9 +62,6 @@ def bitwise_or(evm: Evm) -> None:
     # OPERATION
     push(evm.stack, x | y)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def bitwise_xor(evm: Evm) -> None:
     """
@@ -90,9 +84,6 @@ def bitwise_xor(evm: Evm) -> None:
     # OPERATION
     push(evm.stack, x ^ y)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def bitwise_not(evm: Evm) -> None:
     """
@@ -114,9 +105,6 @@ def bitwise_not(evm: Evm) -> None:
     # OPERATION
     push(evm.stack, ~x)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def get_byte(evm: Evm) -> None:
     """
@@ -149,6 +137,3 @@ def get_byte(evm: Evm) -> None:
         result = word
 
     push(evm.stack, result)
-
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
@@ -48,9 +48,6 @@ def block_hash(evm: Evm) -> None:
 
     push(evm.stack, U256.from_be_bytes(hash))
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def coinbase(evm: Evm) -> None:
     """
@@ -75,9 +72,6 @@ def coinbase(evm: Evm) -> None:
     # OPERATION
     push(evm.stack, U256.from_be_bytes(evm.env.coinbase))
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def timestamp(evm: Evm) -> None:
     """
@@ -102,9 +96,6 @@ def timestamp(evm: Evm) -> None:
     # OPERATION
     push(evm.stack, evm.env.time)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def number(evm: Evm) -> None:
     """
@@ -128,9 +119,6 @@ def number(evm: Evm) -> None:
     # OPERATION
     push(evm.stack, U256(evm.env.number))
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def difficulty(evm: Evm) -> None:
     """
@@ -154,9 +142,6 @@ def difficulty(evm: Evm) -> None:
     # OPERATION
     push(evm.stack, U256(evm.env.difficulty))
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def gas_limit(evm: Evm) -> None:
     """
@@ -179,6 +164,3 @@ def gas_limit(evm: Evm) -> None:
 
     # OPERATION
     push(evm.stack, U256(evm.env.gas_limit))
-
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
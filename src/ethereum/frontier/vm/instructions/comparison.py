@@ -12,7 +12,7 @@ Introduction
 Implementations of the EVM Comparison instructions.
 """
 
-from ethereum_types.numeric import U256, Uint
+from ethereum_types.numeric import U256
 
 from .. import Evm
 from ..gas import GAS_VERY_LOW, charge_gas
@@ -42,9 +42,6 @@ def less_than(evm: Evm) -> None:
 
     push(evm.stack, result)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def signed_less_than(evm: Evm) -> None:
     """
@@ -68,9 +65,6 @@ def signed_less_than(evm: Evm) -> None:
 
     push(evm.stack, result)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def greater_than(evm: Evm) -> None:
     """
@@ -95,9 +89,6 @@ def greater_than(evm: Evm) -> None:
 
     push(evm.stack, result)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def signed_greater_than(evm: Evm) -> None:
     """
@@ -121,9 +112,6 @@ def signed_greater_than(evm: Evm) -> None:
 
     push(evm.stack, result)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def equal(evm: Evm) -> None:
     """
@@ -148,9 +136,6 @@ def equal(evm: Evm) -> None:
 
     push(evm.stack, result)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def is_zero(evm: Evm) -> None:
     """
@@ -173,6 +158,3 @@ def is_zero(evm: Evm) -> None:
     result = U256(x == 0)
 
     push(evm.stack, result)
-
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
@@ -38,9 +38,6 @@ def stop(evm: Evm) -> None:
     # OPERATION
     evm.running = False
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def jump(evm: Evm) -> None:
     """
@@ -71,7 +68,7 @@ def jumpi(evm: Evm) -> None:
     """
     Alter the program counter to the specified location if and only if a
     condition is true. If the condition is not true, then the program counter
-    would increase only by 1.
+    advances to the next instruction.
 
     Parameters
     ----------
@@ -88,14 +85,13 @@ def jumpi(evm: Evm) -> None:
 
     # OPERATION
     if conditional_value == 0:
-        destination = evm.pc + Uint(1)
-    elif jump_dest not in evm.valid_jump_destinations:
+        return
+
+    if jump_dest not in evm.valid_jump_destinations:
         raise InvalidJumpDestError
-    else:
-        destination = jump_dest
 
     # PROGRAM COUNTER
-    evm.pc = destination
+    evm.pc = Uint(jump_dest)
 
 
 def pc(evm: Evm) -> None:
@@ -118,9 +114,6 @@ def pc(evm: Evm) -> None:
     # OPERATION
     push(evm.stack, U256(evm.pc))
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def gas_left(evm: Evm) -> None:
     """
@@ -142,9 +135,6 @@ def gas_left(evm: Evm) -> None:
     # OPERATION
     push(evm.stack, U256(evm.gas_left))
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def jumpdest(evm: Evm) -> None:
     """
@@ -166,6 +156,3 @@ def jumpdest(evm: Evm) -> None:
 
     # OPERATION
     pass
-
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
@@ -14,11 +14,9 @@ Implementations of the EVM environment related instructions.
 
 from ethereum_types.numeric import U256, Uint
 
-from ethereum.utils.numeric import ceil32
-
 from ...state import get_account
 from ...utils.address import to_address
-from ...vm.memory import buffer_read, memory_write
+from ...vm.memory import memory_copy_padded
 from .. import Evm
 from ..gas import (
     GAS_BALANCE,
@@ -31,6 +29,8 @@ from ..gas import (
 )
 from ..stack import pop, push
 
+_ZERO = U256(0)
+
 
 def address(evm: Evm) -> None:
     """
@@ -49,10 +49,7 @@ def address(evm: Evm) -> None:
     charge_gas(evm, GAS_BASE)
 
     # OPERATION
-    push(evm.stack, U256.from_be_bytes(evm.message.current_target))
-
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
+    push(evm.stack, evm.address_word)
 
 
 def balance(evm: Evm) -> None:
@@ -77,9 +74,6 @@ def balance(evm: Evm) -> None:
 
     push(evm.stack, balance)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def origin(evm: Evm) -> None:
     """
@@ -99,10 +93,7 @@ def origin(evm: Evm) -> None:
     charge_gas(evm, GAS_BASE)
 
     # OPERATION
-    push(evm.stack, U256.from_be_bytes(evm.env.origin))
-
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
+    push(evm.stack, evm.origin_word)
 
 
 def caller(evm: Evm) -> None:
@@ -122,10 +113,7 @@ def caller(evm: Evm) -> None:
     charge_gas(evm, GAS_BASE)
 
     # OPERATION
-    push(evm.stack, U256.from_be_bytes(evm.message.caller))
-
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
+    push(evm.stack, evm.caller_word)
 
 
 def callvalue(evm: Evm) -> None:
@@ -147,9 +135,6 @@ def callvalue(evm: Evm) -> None:
     # OPERATION
     push(evm.stack, evm.message.value)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def calldataload(evm: Evm) -> None:
     """
@@ -169,12 +154,14 @@ def calldataload(evm: Evm) -> None:
     charge_gas(evm, GAS_VERY_LOW)
 
     # OPERATION
-    value = buffer_read(evm.message.data, start_index, U256(32))
-
-    push(evm.stack, U256.from_be_bytes(value))
-
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
+    if start_index >= evm.call_data_size:
+        push(evm.stack, _ZERO)
+    else:
+        # Zero padding the word on the right is the same as shifting the bytes
+        # that are present to its high end, so the word is never padded.
+        value = evm.message.data[start_index : Uint(start_index) + Uint(32)]
+        padding_bits = 8 * (32 - len(value))
+        push(evm.stack, U256(int.from_bytes(value, "big") << padding_bits))
 
 
 def calldatasize(evm: Evm) -> None:
@@ -194,10 +181,7 @@ def calldatasize(evm: Evm) -> None:
     charge_gas(evm, GAS_BASE)
 
     # OPERATION
-    push(evm.stack, U256(len(evm.message.data)))
-
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
+    push(evm.stack, evm.call_data_size)
 
 
 def calldatacopy(evm: Evm) -> None:
@@ -219,7 +203,7 @@ def calldatacopy(evm: Evm) -> None:
     size = pop(evm.stack)
 
     # GAS
-    words = ceil32(Uint(size)) // Uint(32)
+    words = Uint((int(size) + 31) >> 5)
     copy_gas_cost = GAS_COPY * words
     extend_memory = calculate_gas_extend_memory(
         evm.memory, [(memory_start_index, size)]
@@ -227,12 +211,14 @@ def calldatacopy(evm: Evm) -> None:
     charge_gas(evm, GAS_VERY_LOW + copy_gas_cost + extend_memory.cost)
 
     # OPERATION
-    evm.memory += b"\x00" * extend_memory.expand_by
-    value = buffer_read(evm.message.data, data_start_index, size)
-    memory_write(evm.memory, memory_start_index, value)
-
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
+    memory_copy_padded(
+        evm.memory,
+        memory_start_index,
+        evm.message.data,
+        data_start_index,
+        size,
+        extend_memory.expand_by,
+    )
 
 
 def codesize(evm: Evm) -> None:
@@ -252,10 +238,7 @@ def codesize(evm: Evm) -> None:
     charge_gas(evm, GAS_BASE)
 
     # OPERATION
-    push(evm.stack, U256(len(evm.code)))
-
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
+    push(evm.stack, evm.code_size)
 
 
 def codecopy(evm: Evm) -> None:
@@ -277,7 +260,7 @@ def codecopy(evm: Evm) -> None:
     size = pop(evm.stack)
 
     # GAS
-    words = ceil32(Uint(size)) // Uint(32)
+    words = Uint((int(size) + 31) >> 5)
     copy_gas_cost = GAS_COPY * words
     extend_memory = calculate_gas_extend_memory(
         evm.memory, [(memory_start_index, size)]
@@ -285,12 +268,14 @@ def codecopy(evm: Evm) -> None:
     charge_gas(evm, GAS_VERY_LOW + copy_gas_cost + extend_memory.cost)
 
     # OPERATION
-    evm.memory += b"\x00" * extend_memory.expand_by
-    value = buffer_read(evm.code, code_start_index, size)
-    memory_write(evm.memory, memory_start_index, value)
-
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
+    memory_copy_padded(
+        evm.memory,
+        memory_start_index,
+        evm.code,
+        code_start_index,
+        size,
+        extend_memory.expand_by,
+    )
 
 
 def gasprice(evm: Evm) -> None:
@@ -312,9 +297,6 @@ def gasprice(evm: Evm) -> None:
     # OPERATION
     push(evm.stack, U256(evm.env.gas_price))
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def extcodesize(evm: Evm) -> None:
     """
@@ -338,9 +320,6 @@ def extcodesize(evm: Evm) -> None:
 
     push(evm.stack, codesize)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def extcodecopy(evm: Evm) -> None:
     """
@@ -359,7 +338,7 @@ def extcodecopy(evm: Evm) -> None:
     size = pop(evm.stack)
 
     # GAS
-    words = ceil32(Uint(size)) // Uint(32)
+    words = Uint((int(size) + 31) >> 5)
     copy_gas_cost = GAS_COPY * words
     extend_memory = calculate_gas_extend_memory(
         evm.memory, [(memory_start_index, size)]
@@ -367,10 +346,12 @@ def extcodecopy(evm: Evm) -> None:
     charge_gas(evm, GAS_EXTERNAL + copy_gas_cost + extend_memory.cost)
 
     # OPERATION
-    evm.memory += b"\x00" * extend_memory.expand_by
     code = get_account(evm.env.state, address).code
-    value = buffer_read(code, code_start_index, size)
-    memory_write(evm.memory, memory_start_index, value)
-
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
+    memory_copy_padded(
+        evm.memory,
+        memory_start_index,
+        code,
+        code_start_index,
+        size,
+        extend_memory.expand_by,
+    )
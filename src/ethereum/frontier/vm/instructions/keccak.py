@@ -59,6 +59,3 @@ def keccak(evm: Evm) -> None:
     hash = keccak256(data)
 
     push(evm.stack, U256.from_be_bytes(hash))
-
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
@@ -72,10 +72,7 @@ def log_n(evm: Evm, num_topics: int) -> None:
         data=memory_read_bytes(evm.memory, memory_start_index, size),
     )
 
-    evm.logs = evm.logs + (log_entry,)
-
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
+    evm.logs.append(log_entry)
 
 
 log0 = partial(log_n, num_topics=0)
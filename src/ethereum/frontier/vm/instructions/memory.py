@@ -12,7 +12,7 @@ Introduction
 Implementations of the EVM Memory instructions.
 """
 from ethereum_types.bytes import Bytes
-from ethereum_types.numeric import U256, Uint
+from ethereum_types.numeric import U256
 
 from .. import Evm
 from ..gas import (
@@ -52,9 +52,6 @@ def mstore(evm: Evm) -> None:
     evm.memory += b"\x00" * extend_memory.expand_by
     memory_write(evm.memory, start_position, value)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def mstore8(evm: Evm) -> None:
     """
@@ -84,9 +81,6 @@ def mstore8(evm: Evm) -> None:
     normalized_bytes_value = Bytes([value & U256(0xFF)])
     memory_write(evm.memory, start_position, normalized_bytes_value)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def mload(evm: Evm) -> None:
     """
@@ -114,9 +108,6 @@ def mload(evm: Evm) -> None:
     )
     push(evm.stack, value)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def msize(evm: Evm) -> None:
     """
@@ -136,6 +127,3 @@ def msize(evm: Evm) -> None:
 
     # OPERATION
     push(evm.stack, U256(len(evm.memory)))
-
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
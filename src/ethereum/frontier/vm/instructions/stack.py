@@ -41,9 +41,6 @@ def pop(evm: Evm) -> None:
     # OPERATION
     pass
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def push_n(evm: Evm, num_bytes: int) -> None:
     """
@@ -71,9 +68,6 @@ def push_n(evm: Evm, num_bytes: int) -> None:
     )
     stack.push(evm.stack, data_to_push)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1) + Uint(num_bytes)
-
 
 def dup_n(evm: Evm, item_number: int) -> None:
     """
@@ -99,9 +93,6 @@ def dup_n(evm: Evm, item_number: int) -> None:
     data_to_duplicate = evm.stack[len(evm.stack) - 1 - item_number]
     stack.push(evm.stack, data_to_duplicate)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def swap_n(evm: Evm, item_number: int) -> None:
     """
@@ -133,9 +124,6 @@ def swap_n(evm: Evm, item_number: int) -> None:
         evm.stack[-1],
     )
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 push1 = partial(push_n, num_bytes=1)
 push2 = partial(push_n, num_bytes=2)
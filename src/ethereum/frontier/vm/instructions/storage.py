@@ -12,8 +12,6 @@ Introduction
 Implementations of the EVM storage related instructions.
 """
 
-from ethereum_types.numeric import Uint
-
 from ...state import get_storage, set_storage
 from .. import Evm
 from ..gas import (
@@ -48,9 +46,6 @@ def sload(evm: Evm) -> None:
 
     push(evm.stack, value)
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def sstore(evm: Evm) -> None:
     """
@@ -80,6 +75,3 @@ def sstore(evm: Evm) -> None:
 
     # OPERATION
     set_storage(evm.env.state, evm.message.current_target, key, new_value)
-
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
@@ -11,6 +11,8 @@ Introduction
 
 Implementations of the EVM system related instructions.
 """
+from typing import TYPE_CHECKING
+
 from ethereum_types.bytes import Bytes0
 from ethereum_types.numeric import U256, Uint
 
@@ -20,10 +22,11 @@ from ...state import (
     account_has_storage,
     get_account,
     increment_nonce,
-    set_account_balance,
+    move_all_ether,
 )
 from ...utils.address import compute_contract_address, to_address
 from .. import (
+    STACK_DEPTH_LIMIT,
     Evm,
     Message,
     incorporate_child_on_error,
@@ -40,6 +43,24 @@ from ..gas import (
 from ..memory import memory_read_bytes, memory_write
 from ..stack import pop, push
 
+_ZERO = U256(0)
+_ONE = U256(1)
+
+if TYPE_CHECKING:
+    from ..interpreter import process_create_message, process_message
+else:
+    process_create_message = process_message = None
+
+
+def _import_interpreter() -> None:
+    """
+    Bind `process_create_message` and `process_message` into this module.
+    They can only be imported once this module has finished loading,
+    because the interpreter imports it too.
+    """
+    global process_create_message, process_message
+    from ..interpreter import process_create_message, process_message
+
 
 def create(evm: Evm) -> None:
     """
@@ -50,9 +71,8 @@ def create(evm: Evm) -> None:
     evm :
         The current EVM frame.
     """
-    # This import causes a circular import error
-    # if it's not moved inside this method
-    from ...vm.interpreter import STACK_DEPTH_LIMIT, process_create_message
+    if process_create_message is None:
+        _import_interpreter()
 
     # STACK
     endowment = pop(evm.stack)
@@ -74,23 +94,20 @@ def create(evm: Evm) -> None:
     sender_address = evm.message.current_target
     sender = get_account(evm.env.state, sender_address)
 
-    contract_address = compute_contract_address(
-        evm.message.current_target,
-        get_account(evm.env.state, evm.message.current_target).nonce,
-    )
+    contract_address = compute_contract_address(sender_address, sender.nonce)
 
     if (
         sender.balance < endowment
         or sender.nonce == Uint(2**64 - 1)
-        or evm.message.depth + Uint(1) > STACK_DEPTH_LIMIT
+        or evm.message.depth >= STACK_DEPTH_LIMIT
     ):
-        push(evm.stack, U256(0))
+        push(evm.stack, _ZERO)
         evm.gas_left += create_message_gas
     elif account_has_code_or_nonce(
         evm.env.state, contract_address
     ) or account_has_storage(evm.env.state, contract_address):
         increment_nonce(evm.env.state, evm.message.current_target)
-        push(evm.stack, U256(0))
+        push(evm.stack, _ZERO)
     else:
         call_data = memory_read_bytes(
             evm.memory, memory_start_position, memory_size
@@ -114,16 +131,13 @@ def create(evm: Evm) -> None:
 
         if child_evm.error:
             incorporate_child_on_error(evm, child_evm)
-            push(evm.stack, U256(0))
+            push(evm.stack, _ZERO)
         else:
             incorporate_child_on_success(evm, child_evm)
             push(
                 evm.stack, U256.from_be_bytes(child_evm.message.current_target)
             )
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def return_(evm: Evm) -> None:
     """
@@ -153,9 +167,6 @@ def return_(evm: Evm) -> None:
 
     evm.running = False
 
-    # PROGRAM COUNTER
-    pass
-
 
 def generic_call(
     evm: Evm,
@@ -172,11 +183,12 @@ def generic_call(
     """
     Perform the core logic of the `CALL*` family of opcodes.
     """
-    from ...vm.interpreter import STACK_DEPTH_LIMIT, process_message
+    if process_message is None:
+        _import_interpreter()
 
-    if evm.message.depth + Uint(1) > STACK_DEPTH_LIMIT:
+    if evm.message.depth >= STACK_DEPTH_LIMIT:
         evm.gas_left += gas
-        push(evm.stack, U256(0))
+        push(evm.stack, _ZERO)
         return
 
     call_data = memory_read_bytes(
@@ -199,10 +211,10 @@ def generic_call(
 
     if child_evm.error:
         incorporate_child_on_error(evm, child_evm)
-        push(evm.stack, U256(0))
+        push(evm.stack, _ZERO)
     else:
         incorporate_child_on_success(evm, child_evm)
-        push(evm.stack, U256(1))
+        push(evm.stack, _ONE)
 
     actual_output_size = min(memory_output_size, U256(len(child_evm.output)))
     memory_write(
@@ -249,7 +261,7 @@ def call(evm: Evm) -> None:
         evm.env.state, evm.message.current_target
     ).balance
     if sender_balance < value:
-        push(evm.stack, U256(0))
+        push(evm.stack, _ZERO)
         evm.gas_left += message_call_gas.stipend
     else:
         generic_call(
@@ -265,9 +277,6 @@ def call(evm: Evm) -> None:
             memory_output_size,
         )
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def callcode(evm: Evm) -> None:
     """
@@ -308,7 +317,7 @@ def callcode(evm: Evm) -> None:
         evm.env.state, evm.message.current_target
     ).balance
     if sender_balance < value:
-        push(evm.stack, U256(0))
+        push(evm.stack, _ZERO)
         evm.gas_left += message_call_gas.stipend
     else:
         generic_call(
@@ -324,9 +333,6 @@ def callcode(evm: Evm) -> None:
             memory_output_size,
         )
 
-    # PROGRAM COUNTER
-    evm.pc += Uint(1)
-
 
 def selfdestruct(evm: Evm) -> None:
     """
@@ -357,23 +363,12 @@ def selfdestruct(evm: Evm) -> None:
     charge_gas(evm, gas_cost)
 
     # OPERATION
-    beneficiary_balance = get_account(evm.env.state, beneficiary).balance
-    originator_balance = get_account(evm.env.state, originator).balance
-
-    # First Transfer to beneficiary
-    set_account_balance(
-        evm.env.state, beneficiary, beneficiary_balance + originator_balance
-    )
-    # Next, Zero the balance of the address being deleted (must come after
-    # sending to beneficiary in case the contract named itself as the
-    # beneficiary).
-    set_account_balance(evm.env.state, originator, U256(0))
+    # Transfer the balance to the beneficiary. If the contract named itself
+    # as the beneficiary, the balance is destroyed.
+    move_all_ether(evm.env.state, originator, beneficiary)
 
     # register account for deletion
     evm.accounts_to_delete.add(originator)
 
     # HALT the execution
     evm.running = False
-
-    # PROGRAM COUNTER
-    pass
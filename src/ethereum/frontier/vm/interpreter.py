@@ -16,7 +16,7 @@ from dataclasses import dataclass
 from typing import Optional, Set, Tuple
 
 from ethereum_types.bytes import Bytes0
-from ethereum_types.numeric import U256, Uint, ulen
+from ethereum_types.numeric import U256, Uint
 
 from ethereum.exceptions import EthereumException
 from ethereum.trace import (
@@ -46,17 +46,15 @@ from ..state import (
 from ..vm import Message
 from ..vm.gas import GAS_CODE_DEPOSIT, charge_gas
 from ..vm.precompiled_contracts.mapping import PRE_COMPILED_CONTRACTS
-from . import Environment, Evm
+from . import STACK_DEPTH_LIMIT, Environment, Evm
 from .exceptions import (
     AddressCollision,
     ExceptionalHalt,
     InvalidOpcode,
     StackDepthLimitError,
 )
-from .instructions import Ops, op_implementation
-from .runtime import get_valid_jump_destinations
-
-STACK_DEPTH_LIMIT = Uint(1024)
+from .instructions import Ops
+from .runtime import analyze_code
 
 
 @dataclass
@@ -118,7 +116,7 @@ def process_message_call(
         accounts_to_delete = set()
         refund_counter = U256(0)
     else:
-        logs = evm.logs
+        logs = tuple(evm.logs)
         accounts_to_delete = evm.accounts_to_delete
         refund_counter = U256(evm.refund_counter)
 
@@ -234,17 +232,22 @@ def execute_code(message: Message, env: Environment) -> Evm:
         Items containing execution specific objects
     """
     code = message.code
-    valid_jump_destinations = get_valid_jump_destinations(code)
+    analysis = analyze_code(code)
 
     evm = Evm(
         pc=Uint(0),
         stack=[],
         memory=bytearray(),
         code=code,
+        code_size=U256(len(code)),
+        call_data_size=U256(len(message.data)),
+        address_word=U256.from_be_bytes(message.current_target),
+        caller_word=U256.from_be_bytes(message.caller),
+        origin_word=U256.from_be_bytes(env.origin),
         gas_left=message.gas,
         env=env,
-        valid_jump_destinations=valid_jump_destinations,
-        logs=(),
+        valid_jump_destinations=analysis.valid_jump_destinations,
+        logs=[],
         refund_counter=0,
         running=True,
         message=message,
@@ -259,16 +262,29 @@ def execute_code(message: Message, env: Environment) -> Evm:
             evm_trace(evm, PrecompileEnd())
             return evm
 
-        while evm.running and evm.pc < ulen(evm.code):
-            try:
-                op = Ops(evm.code[evm.pc])
-            except ValueError:
+        inst_to_pc = analysis.inst_to_pc
+        instruction = 0
+        pc = evm.pc
+
+        while evm.running and instruction < len(analysis.ops):
+            op = analysis.ops[instruction]
+            handler = analysis.handlers[instruction]
+            if op is None or handler is None:
                 raise InvalidOpcode(evm.code[evm.pc])
 
             evm_trace(evm, OpStart(op))
-            op_implementation[op](evm)
+            handler(evm)
             evm_trace(evm, OpEnd())
 
+            # Instructions only write to the program counter when they jump,
+            # so an unchanged `Uint` object means the next instruction runs.
+            if evm.pc is pc:
+                instruction += 1
+                pc = evm.pc = Uint(inst_to_pc[instruction])
+            else:
+                pc = evm.pc
+                instruction = analysis.pc_to_inst[pc]
+
         evm_trace(evm, EvmStop(Ops.STOP))
 
     except ExceptionalHalt as error:
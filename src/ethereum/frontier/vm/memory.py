@@ -35,6 +35,52 @@ def memory_write(
     memory[start_position : int(start_position) + len(value)] = value
 
 
+def memory_copy_padded(
+    memory: bytearray,
+    start_position: U256,
+    buffer: Bytes,
+    buffer_start_position: U256,
+    size: U256,
+    expand_by: Uint,
+) -> None:
+    """
+    Extends memory and copies `size` bytes of `buffer` to it, padding with
+    zeros if the buffer ends early.
+
+    The bytes are copied straight out of `buffer` without slicing it first.
+    Memory added by the extension is already zero, so the padding is only
+    written where it overlaps memory that existed before.
+
+    Parameters
+    ----------
+    memory :
+        Memory contents of the EVM.
+    start_position :
+        Starting pointer to the memory.
+    buffer :
+        Data to copy to memory.
+    buffer_start_position :
+        Starting pointer to the data in `buffer`.
+    size :
+        Number of bytes written in total.
+    expand_by :
+        Number of bytes the memory has to be extended by.
+    """
+    previous_size = len(memory)
+    memory += b"\x00" * expand_by
+
+    with memoryview(buffer) as view:
+        value = view[
+            buffer_start_position : Uint(buffer_start_position) + Uint(size)
+        ]
+        value_end = int(start_position) + len(value)
+        memory[start_position:value_end] = value
+
+    padding_end = min(int(start_position) + int(size), previous_size)
+    if value_end < padding_end:
+        memory[value_end:padding_end] = b"\x00" * (padding_end - value_end)
+
+
 def memory_read_bytes(
     memory: bytearray, start_position: U256, size: U256
 ) -> bytearray:
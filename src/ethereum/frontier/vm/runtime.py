@@ -11,16 +11,48 @@ Introduction
 
 Runtime related operations used while executing EVM code.
 """
-from typing import Set
+from array import array
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Set
 
-from ethereum_types.numeric import Uint, ulen
+from ethereum_types.numeric import Uint
 
-from .instructions import Ops
+from .instructions import Ops, op_implementation
 
 
-def get_valid_jump_destinations(code: bytes) -> Set[Uint]:
+@dataclass
+class SimpleAnalysis:
     """
-    Analyze the evm code to obtain the set of valid jump destinations.
+    The instruction stream of a piece of EVM code, decoded once when the code
+    is loaded so that the interpreter does not have to decode it on every
+    step.
+
+    `inst_to_pc[i]` is the position in the code of the `i`-th instruction. It
+    has one trailing entry holding the position just past the last
+    instruction. `pc_to_inst` maps every position that starts an instruction
+    back to its index in the stream.
+
+    `ops` and `handlers` hold the opcode and the implementation of each
+    instruction. Both are `None` for bytes that are not valid opcodes.
+
+    `valid_jump_destinations` is the set of positions of the `JUMPDEST`
+    instructions in the stream.
+    """
+
+    inst_to_pc: "array[int]"
+    pc_to_inst: "array[int]"
+    ops: List[Optional[Ops]]
+    handlers: List[Optional[Callable]]
+    valid_jump_destinations: Set[Uint]
+
+
+def analyze_code(code: bytes) -> SimpleAnalysis:
+    """
+    Split the evm code into its sequence of instructions, and collect the set
+    of valid jump destinations.
+
+    `PUSH-N` opcodes are decoded together with their trailing data segment,
+    so that the data is never mistaken for an instruction.
 
     Valid jump destinations are defined as follows:
         * The jump destination is less than the length of the code.
@@ -37,31 +69,42 @@ def get_valid_jump_destinations(code: bytes) -> Set[Uint]:
 
     Returns
     -------
-    valid_jump_destinations: `Set[Uint]`
-        The set of valid jump destinations in the code.
+    analysis: `SimpleAnalysis`
+        The instruction stream of the code.
     """
+    inst_to_pc = array("I")
+    pc_to_inst = array("I", [0]) * len(code)
+    ops: List[Optional[Ops]] = []
+    handlers: List[Optional[Callable]] = []
     valid_jump_destinations = set()
-    pc = Uint(0)
+    pc = 0
+
+    while pc < len(code):
+        pc_to_inst[pc] = len(inst_to_pc)
+        inst_to_pc.append(pc)
 
-    while pc < ulen(code):
         try:
             current_opcode = Ops(code[pc])
         except ValueError:
-            # Skip invalid opcodes, as they don't affect the jumpdest
-            # analysis. Nevertheless, such invalid opcodes would be caught
-            # and raised when the interpreter runs.
-            pc += Uint(1)
+            # Invalid opcodes are only raised once the interpreter reaches
+            # them.
+            ops.append(None)
+            handlers.append(None)
+            pc += 1
             continue
 
+        ops.append(current_opcode)
+        handlers.append(op_implementation[current_opcode])
+
         if current_opcode == Ops.JUMPDEST:
-            valid_jump_destinations.add(pc)
+            valid_jump_destinations.add(Uint(pc))
         elif Ops.PUSH1.value <= current_opcode.value <= Ops.PUSH32.value:
-            # If PUSH-N opcodes are encountered, skip the current opcode along
-            # with the trailing data segment corresponding to the PUSH-N
-            # opcodes.
-            push_data_size = current_opcode.value - Ops.PUSH1.value + 1
-            pc += Uint(push_data_size)
+            pc += current_opcode.value - Ops.PUSH1.value + 1
+
+        pc += 1
 
-        pc += Uint(1)
+    inst_to_pc.append(pc)
 
-    return valid_jump_destinations
+    return SimpleAnalysis(
+        inst_to_pc, pc_to_inst, ops, handlers, valid_jump_destinations
+    )
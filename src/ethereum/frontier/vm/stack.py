@@ -34,7 +34,7 @@ def pop(stack: List[U256]) -> U256:
         The top element on the stack.
 
     """
-    if len(stack) == 0:
+    if not stack:
         raise StackUnderflowError
 
     return stack.pop()
@@ -56,4 +56,4 @@ def push(stack: List[U256], value: U256) -> None:
     if len(stack) == 1024:
         raise StackOverflowError
 
-    return stack.append(value)
+    stack.append(value)
@@ -46,6 +46,30 @@ def monkey_patch_optimized_state_db(
         slow_state.State.default_path = state_path
 
 
+def monkey_patch_optimized_interpreter(fork_name: str) -> None:
+    """
+    Replace the code analysis done when loading EVM code with a JIT compiled
+    one.
+
+    This function must be called after the state interface has been patched,
+    since it imports the fork's virtual machine.
+    """
+    # Imported here so that importing this package does not compile (or load)
+    # the JIT kernels.
+    from .interpreter_jit import get_optimized_interpreter_patches
+
+    optimized_interpreter_patches = get_optimized_interpreter_patches(
+        fork_name
+    )
+
+    for module_name in ("vm.runtime", "vm.interpreter"):
+        slow_module = import_module(
+            "ethereum." + fork_name + "." + module_name
+        )
+        for name, value in optimized_interpreter_patches.items():
+            setattr(slow_module, name, value)
+
+
 def monkey_patch_optimized_spec(fork_name: str) -> None:
     """
     Replace the ethash implementation with one that supports higher
@@ -64,12 +88,15 @@ def monkey_patch_optimized_spec(fork_name: str) -> None:
 
 def monkey_patch(state_path: Optional[str]) -> None:
     """
-    Apply all monkey patches to the specification.
+    Apply all monkey patches to the specification: the optimized state, the
+    JIT compiled code analysis and, on proof-of-work forks, the optimized
+    ethash.
     """
     forks = Hardfork.discover()
 
     for fork in forks:
         monkey_patch_optimized_state_db(fork.short_name, state_path)
+        monkey_patch_optimized_interpreter(fork.short_name)
 
         # Only patch the POW code on POW forks
         if fork.consensus.is_pow():
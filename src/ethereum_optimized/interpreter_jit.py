@@ -0,0 +1,114 @@
+"""
+Optimized Interpreter
+^^^^^^^^^^^^^^^^^^^^^
+
+.. contents:: Table of Contents
+    :backlinks: none
+    :local:
+
+Introduction
+------------
+
+This module contains a JIT compiled code analysis that can be monkey patched
+into the `vm.runtime` and `vm.interpreter` modules of a fork.
+"""
+from array import array
+from importlib import import_module
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+from ethereum_types.bytes import Bytes
+from ethereum_types.numeric import Uint
+
+from .utils import add_item
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError as e:
+    # Add a message, but keep it an ImportError.
+    raise e from Exception(
+        "Install with `pip install 'ethereum[optimized]'` to enable this "
+        "package"
+    )
+
+Analysis_ = Any
+
+JUMPDEST = 0x5B
+PUSH1 = 0x60
+PUSH32 = 0x7F
+
+
+@njit(cache=True, boundscheck=False)
+def scan_instructions(code: Any) -> Tuple[Any, Any]:
+    """
+    Compute the `inst_to_pc` and `pc_to_inst` tables of a `uint8` code
+    buffer. See `analyze_code`.
+    """
+    code_length = code.shape[0]
+    inst_to_pc = np.empty(code_length + 1, dtype=np.uintc)
+    pc_to_inst = np.zeros(code_length, dtype=np.uintc)
+    instruction = 0
+    pc = 0
+
+    while pc < code_length:
+        pc_to_inst[pc] = instruction
+        inst_to_pc[instruction] = pc
+        instruction += 1
+
+        opcode = code[pc]
+        if PUSH1 <= opcode <= PUSH32:
+            pc += opcode - PUSH1 + 1
+
+        pc += 1
+
+    inst_to_pc[instruction] = pc
+
+    return inst_to_pc[: instruction + 1], pc_to_inst
+
+
+# Compile (or load from the on-disk cache) while importing, so that the first
+# message call does not pay for it.
+scan_instructions(np.zeros(1, dtype=np.uint8))
+
+
+def get_optimized_interpreter_patches(fork: str) -> Dict[str, Any]:
+    """
+    Get a dictionary of functions to be monkey patched into the interpreter
+    to make it optimized.
+    """
+    patches: Dict[str, Any] = {}
+
+    runtime_mod = cast(Any, import_module("ethereum." + fork + ".vm.runtime"))
+    instructions_mod = cast(
+        Any, import_module("ethereum." + fork + ".vm.instructions")
+    )
+
+    if not hasattr(runtime_mod, "analyze_code"):
+        return patches
+
+    op_table: List[Optional[Any]] = [None] * 256
+    handler_table: List[Optional[Any]] = [None] * 256
+    for op in instructions_mod.Ops:
+        op_table[op.value] = op
+        handler_table[op.value] = instructions_mod.op_implementation[op]
+
+    @add_item(patches)
+    def analyze_code(code: Bytes) -> Analysis_:
+        """
+        See `analyze_code`.
+        """
+        buffer = np.frombuffer(code, dtype=np.uint8)
+        inst_to_pc, pc_to_inst = scan_instructions(buffer)
+        opcodes = buffer[inst_to_pc[:-1]]
+        jump_destinations = inst_to_pc[:-1][opcodes == JUMPDEST].tolist()
+        opcodes = opcodes.tolist()
+
+        return runtime_mod.SimpleAnalysis(
+            array("I", inst_to_pc.tobytes()),
+            array("I", pc_to_inst.tobytes()),
+            [op_table[opcode] for opcode in opcodes],
+            [handler_table[opcode] for opcode in opcodes],
+            {Uint(pc) for pc in jump_destinations},
+        )
+
+    return patches
@@ -1,7 +1,10 @@
+import random
 from functools import partial
 
 import pytest
+from ethereum_types.numeric import Uint
 
+from ethereum.utils.numeric import ceil32
 from tests.helpers import TEST_FIXTURES
 
 from ..vm.vm_test_helpers import run_test
@@ -105,3 +108,13 @@ def test_codecopy(test_file: str) -> None:
 
 def test_gasprice() -> None:
     run_environmental_vm_test("gasprice.json")
+
+
+@pytest.mark.parametrize(
+    "size",
+    [0, 1, 31, 32, 33, 2**64 - 1, 2**256 - 1]
+    + [random.Random(seed).getrandbits(64) for seed in range(16)],
+)
+def test_copy_words(size: int) -> None:
+    # The `*COPY` instructions count words with a shift instead of `ceil32`.
+    assert ceil32(Uint(size)) // Uint(32) == Uint((size + 31) >> 5)
@@ -0,0 +1,43 @@
+from ethereum_types.numeric import Uint
+
+from ethereum.frontier.vm.instructions import Ops, op_implementation
+from ethereum.frontier.vm.runtime import analyze_code
+
+
+def test_analyze_code() -> None:
+    code = bytes(
+        [
+            Ops.PUSH2.value,
+            Ops.JUMPDEST.value,
+            Ops.JUMPDEST.value,
+            Ops.JUMPDEST.value,
+            0xFE,
+            Ops.ADD.value,
+            # Truncated `PUSH-N` at the end of the code.
+            Ops.PUSH3.value,
+            Ops.JUMPDEST.value,
+        ]
+    )
+    analysis = analyze_code(code)
+
+    assert list(analysis.inst_to_pc) == [0, 3, 4, 5, 6, 10]
+    for instruction, pc in enumerate(analysis.inst_to_pc[:-1]):
+        assert analysis.pc_to_inst[pc] == instruction
+    assert analysis.ops == [Ops.PUSH2, Ops.JUMPDEST, None, Ops.ADD, Ops.PUSH3]
+    assert analysis.handlers == [
+        op_implementation[Ops.PUSH2],
+        op_implementation[Ops.JUMPDEST],
+        None,
+        op_implementation[Ops.ADD],
+        op_implementation[Ops.PUSH3],
+    ]
+    # The `JUMPDEST` bytes inside `PUSH-N` data are not jump destinations.
+    assert analysis.valid_jump_destinations == {Uint(3)}
+
+
+def test_analyze_empty_code() -> None:
+    analysis = analyze_code(b"")
+
+    assert list(analysis.inst_to_pc) == [0]
+    assert analysis.ops == []
+    assert analysis.valid_jump_destinations == set()
@@ -0,0 +1,67 @@
+import sys
+from typing import List, Optional, Set
+
+import pytest
+from ethereum_types.numeric import Uint
+
+from ethereum.frontier.vm.instructions import Ops, op_implementation
+
+try:
+    import ethereum_optimized.interpreter_jit as interpreter_jit
+
+    optimized_runtime = interpreter_jit.get_optimized_interpreter_patches(
+        "frontier"
+    )
+except ImportError:
+    pass
+
+
+@pytest.mark.skipif(
+    "ethereum_optimized.interpreter_jit" not in sys.modules,
+    reason="missing dependency (use `pip install 'ethereum[optimized]'`)",
+)
+@pytest.mark.parametrize(
+    "code,inst_to_pc,ops,valid_jump_destinations",
+    [
+        (b"", [0], [], set()),
+        (bytes([Ops.STOP.value]), [0, 1], [Ops.STOP], set()),
+        (
+            bytes([Ops.PUSH1.value, Ops.JUMPDEST.value, Ops.JUMPDEST.value]),
+            [0, 2, 3],
+            [Ops.PUSH1, Ops.JUMPDEST],
+            {Uint(2)},
+        ),
+        # `JUMPDEST` bytes in `PUSH32` data, followed by an invalid opcode.
+        (
+            bytes([Ops.PUSH32.value]) + b"\x5b" * 32 + b"\xfe\x01",
+            [0, 33, 34, 35],
+            [Ops.PUSH32, None, Ops.ADD],
+            set(),
+        ),
+        # Truncated `PUSH-N` at the end of the code.
+        (
+            bytes([Ops.ADD.value, Ops.PUSH4.value, Ops.JUMPDEST.value]),
+            [0, 1, 6],
+            [Ops.ADD, Ops.PUSH4],
+            set(),
+        ),
+    ],
+)
+def test_analyze_code(
+    code: bytes,
+    inst_to_pc: List[int],
+    ops: List[Optional[Ops]],
+    valid_jump_destinations: Set[Uint],
+) -> None:
+    analysis = optimized_runtime["analyze_code"](code)
+
+    assert analysis.inst_to_pc.typecode == "I"
+    assert analysis.pc_to_inst.typecode == "I"
+    assert list(analysis.inst_to_pc) == inst_to_pc
+    for instruction, pc in enumerate(inst_to_pc[:-1]):
+        assert analysis.pc_to_inst[pc] == instruction
+    assert analysis.ops == ops
+    assert analysis.handlers == [
+        None if op is None else op_implementation[op] for op in ops
+    ]
+    assert analysis.valid_jump_destinations == valid_jump_destinations